@@ -10,7 +10,14 @@ import logging
 from pathlib import Path
 
 from claude_agent_sdk import ClaudeSDKClient
-from debug import debug, debug_detailed, debug_error, debug_section, debug_success
+from debug import (
+    debug,
+    debug_detailed,
+    debug_error,
+    debug_section,
+    debug_success,
+    is_debug_enabled,
+)
 from insight_extractor import extract_session_insights
 from linear_updater import (
     linear_subtask_completed,
@@ -334,15 +341,16 @@ async def run_agent_session(
         - "complete" if all subtasks complete
         - "error" if an error occurred
     """
-    debug_section("session", f"Agent Session - {phase.value}")
-    debug(
-        "session",
-        "Starting agent session",
-        spec_dir=str(spec_dir),
-        phase=phase.value,
-        prompt_length=len(message),
-        prompt_preview=message[:200] + "..." if len(message) > 200 else message,
-    )
+    if is_debug_enabled():
+        debug_section("session", f"Agent Session - {phase.value}")
+        debug(
+            "session",
+            "Starting agent session",
+            spec_dir=str(spec_dir),
+            phase=phase.value,
+            prompt_length=len(message),
+            prompt_preview=message[:200] + "..." if len(message) > 200 else message,
+        )
     print("Sending prompt to Claude Agent SDK...\n")
 
     # Get task logger for this spec
@@ -360,14 +368,19 @@ async def run_agent_session(
         # Collect response text and show tool use
         response_text = ""
         debug("session", "Starting to receive response stream...")
+        # Debug calls inside the stream loop are guarded at the call site so
+        # their f-strings and str() conversions of tool payloads are skipped
+        # entirely when debug mode is off
+        debug_enabled = is_debug_enabled()
         async for msg in client.receive_response():
             msg_type = type(msg).__name__
             message_count += 1
-            debug_detailed(
-                "session",
-                f"Received message #{message_count}",
-                msg_type=msg_type,
-            )
+            if debug_enabled:
+                debug_detailed(
+                    "session",
+                    f"Received message #{message_count}",
+                    msg_type=msg_type,
+                )
 
             # Handle AssistantMessage (text and tool use)
             if msg_type == "AssistantMessage" and hasattr(msg, "content"):
@@ -410,12 +423,13 @@ async def run_agent_session(
                             elif "path" in inp:
                                 tool_input_display = inp["path"]
 
-                        debug(
-                            "session",
-                            f"Tool call #{tool_count}: {tool_name}",
-                            tool_input=tool_input_display,
-                            full_input=str(inp)[:500] if inp else None,
-                        )
+                        if debug_enabled:
+                            debug(
+                                "session",
+                                f"Tool call #{tool_count}: {tool_name}",
+                                tool_input=tool_input_display,
+                                full_input=str(inp)[:500] if inp else None,
+                            )
 
                         # Log tool start (handles printing too)
                         if task_logger:
@@ -482,11 +496,12 @@ async def run_agent_session(
                                 )
                         else:
                             # Tool succeeded
-                            debug_detailed(
-                                "session",
-                                f"Tool success: {current_tool}",
-                                result_length=len(str(result_content)),
-                            )
+                            if debug_enabled:
+                                debug_detailed(
+                                    "session",
+                                    f"Tool success: {current_tool}",
+                                    result_length=len(str(result_content)),
+                                )
                             if verbose:
                                 result_str = str(result_content)[:200]
                                 print(f"   [Done] {result_str}", flush=True)
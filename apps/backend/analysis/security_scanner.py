@@ -25,6 +25,7 @@ from __future__ import annotations
 
 import json
 import subprocess
+from collections import Counter
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
@@ -442,6 +443,9 @@ class SecurityScanner:
 
     def to_dict(self, result: SecurityScanResult) -> dict[str, Any]:
         """Convert result to dictionary for JSON serialization."""
+        # Bucket vulnerabilities by severity in a single pass
+        severity_counts = Counter(v.severity for v in result.vulnerabilities)
+
         return {
             "secrets": result.secrets,
             "vulnerabilities": [
@@ -462,18 +466,10 @@ class SecurityScanner:
             "summary": {
                 "total_secrets": len(result.secrets),
                 "total_vulnerabilities": len(result.vulnerabilities),
-                "critical_count": sum(
-                    1 for v in result.vulnerabilities if v.severity == "critical"
-                ),
-                "high_count": sum(
-                    1 for v in result.vulnerabilities if v.severity == "high"
-                ),
-                "medium_count": sum(
-                    1 for v in result.vulnerabilities if v.severity == "medium"
-                ),
-                "low_count": sum(
-                    1 for v in result.vulnerabilities if v.severity == "low"
-                ),
+                "critical_count": severity_counts["critical"],
+                "high_count": severity_counts["high"],
+                "medium_count": severity_counts["medium"],
+                "low_count": severity_counts["low"],
             },
         }
 
@@ -46,20 +46,25 @@ def count_subtasks(spec_dir: Path) -> tuple[int, int]:
         with open(plan_file, encoding="utf-8") as f:
             plan = json.load(f)
 
-        total = 0
-        completed = 0
-
-        for phase in plan.get("phases", []):
-            for subtask in phase.get("subtasks", []):
-                total += 1
-                if subtask.get("status") == "completed":
-                    completed += 1
-
-        return completed, total
+        return _count_plan_subtasks(plan)
     except (OSError, json.JSONDecodeError, UnicodeDecodeError):
         return 0, 0
 
 
+def _count_plan_subtasks(plan: dict) -> tuple[int, int]:
+    """Count (completed, total) subtasks in an already-loaded plan."""
+    total = 0
+    completed = 0
+
+    for phase in plan.get("phases", []):
+        for subtask in phase.get("subtasks", []):
+            total += 1
+            if subtask.get("status") == "completed":
+                completed += 1
+
+    return completed, total
+
+
 def count_subtasks_detailed(spec_dir: Path) -> dict:
     """
     Count subtasks by status.
@@ -166,7 +171,18 @@ def print_session_header(
 
 def print_progress_summary(spec_dir: Path, show_next: bool = True) -> None:
     """Print a summary of current progress with enhanced formatting."""
-    completed, total = count_subtasks(spec_dir)
+    # Load the plan once and reuse it for the counts, the phase summary and
+    # the next-subtask lookup instead of re-reading it for each
+    plan_file = spec_dir / "implementation_plan.json"
+    plan = None
+    if plan_file.exists():
+        try:
+            with open(plan_file, encoding="utf-8") as f:
+                plan = json.load(f)
+        except (OSError, json.JSONDecodeError, UnicodeDecodeError):
+            plan = None  # Treat corrupted/unreadable progress files as missing
+
+    completed, total = _count_plan_subtasks(plan) if plan else (0, 0)
 
     if total > 0:
         print()
@@ -181,57 +197,50 @@ def print_progress_summary(spec_dir: Path, show_next: bool = True) -> None:
             print_status(f"{remaining} subtasks remaining", "info")
 
         # Phase summary
-        try:
-            with open(spec_dir / "implementation_plan.json", encoding="utf-8") as f:
-                plan = json.load(f)
-
-            print("\nPhases:")
-            for phase in plan.get("phases", []):
-                phase_subtasks = phase.get("subtasks", [])
-                phase_completed = sum(
-                    1 for s in phase_subtasks if s.get("status") == "completed"
+        print("\nPhases:")
+        for phase in plan.get("phases", []):
+            phase_subtasks = phase.get("subtasks", [])
+            phase_completed = sum(
+                1 for s in phase_subtasks if s.get("status") == "completed"
+            )
+            phase_total = len(phase_subtasks)
+            phase_name = phase.get("name", phase.get("id", "Unknown"))
+
+            if phase_completed == phase_total:
+                status = "complete"
+            elif phase_completed > 0 or any(
+                s.get("status") == "in_progress" for s in phase_subtasks
+            ):
+                status = "in_progress"
+            else:
+                # Check if blocked by dependencies
+                deps = phase.get("depends_on", [])
+                all_deps_complete = True
+                for dep_id in deps:
+                    for p in plan.get("phases", []):
+                        if p.get("id") == dep_id or p.get("phase") == dep_id:
+                            p_subtasks = p.get("subtasks", [])
+                            if not all(
+                                s.get("status") == "completed" for s in p_subtasks
+                            ):
+                                all_deps_complete = False
+                            break
+                status = "pending" if all_deps_complete else "blocked"
+
+            print_phase_status(phase_name, phase_completed, phase_total, status)
+
+        # Show next subtask if requested
+        if show_next and completed < total:
+            next_subtask = _find_next_subtask(plan)
+            if next_subtask:
+                print()
+                next_id = next_subtask.get("id", "unknown")
+                next_desc = next_subtask.get("description", "")
+                if len(next_desc) > 60:
+                    next_desc = next_desc[:57] + "..."
+                print(
+                    f"  {icon(Icons.ARROW_RIGHT)} Next: {highlight(next_id)} - {next_desc}"
                 )
-                phase_total = len(phase_subtasks)
-                phase_name = phase.get("name", phase.get("id", "Unknown"))
-
-                if phase_completed == phase_total:
-                    status = "complete"
-                elif phase_completed > 0 or any(
-                    s.get("status") == "in_progress" for s in phase_subtasks
-                ):
-                    status = "in_progress"
-                else:
-                    # Check if blocked by dependencies
-                    deps = phase.get("depends_on", [])
-                    all_deps_complete = True
-                    for dep_id in deps:
-                        for p in plan.get("phases", []):
-                            if p.get("id") == dep_id or p.get("phase") == dep_id:
-                                p_subtasks = p.get("subtasks", [])
-                                if not all(
-                                    s.get("status") == "completed" for s in p_subtasks
-                                ):
-                                    all_deps_complete = False
-                                break
-                    status = "pending" if all_deps_complete else "blocked"
-
-                print_phase_status(phase_name, phase_completed, phase_total, status)
-
-            # Show next subtask if requested
-            if show_next and completed < total:
-                next_subtask = get_next_subtask(spec_dir)
-                if next_subtask:
-                    print()
-                    next_id = next_subtask.get("id", "unknown")
-                    next_desc = next_subtask.get("description", "")
-                    if len(next_desc) > 60:
-                        next_desc = next_desc[:57] + "..."
-                    print(
-                        f"  {icon(Icons.ARROW_RIGHT)} Next: {highlight(next_id)} - {next_desc}"
-                    )
-
-        except (OSError, json.JSONDecodeError, UnicodeDecodeError):
-            pass  # Ignore corrupted/unreadable progress files
     else:
         print()
         print_status("No implementation subtasks yet - planner needs to run", "pending")
@@ -419,59 +428,60 @@ def get_next_subtask(spec_dir: Path) -> dict | None:
         with open(plan_file, encoding="utf-8") as f:
             plan = json.load(f)
 
-        phases = plan.get("phases", [])
-
-        # Build a map of phase completion
-        phase_complete: dict[str, bool] = {}
-        for i, phase in enumerate(phases):
-            phase_id_value = phase.get("id")
-            phase_id_raw = (
-                phase_id_value if phase_id_value is not None else phase.get("phase")
-            )
-            phase_id_key = (
-                str(phase_id_raw) if phase_id_raw is not None else f"unknown:{i}"
-            )
-            subtasks = phase.get("subtasks", phase.get("chunks", []))
-            phase_complete[phase_id_key] = all(
-                s.get("status") == "completed" for s in subtasks
-            )
-
-        # Find next available subtask
-        for phase in phases:
-            phase_id_value = phase.get("id")
-            phase_id = (
-                phase_id_value if phase_id_value is not None else phase.get("phase")
-            )
-            depends_on_raw = phase.get("depends_on", [])
-            if isinstance(depends_on_raw, list):
-                depends_on = [str(d) for d in depends_on_raw if d is not None]
-            elif depends_on_raw is None:
-                depends_on = []
-            else:
-                depends_on = [str(depends_on_raw)]
+        return _find_next_subtask(plan)
 
-            # Check if dependencies are satisfied
-            deps_satisfied = all(phase_complete.get(dep, False) for dep in depends_on)
-            if not deps_satisfied:
-                continue
+    except (OSError, json.JSONDecodeError, UnicodeDecodeError):
+        return None
 
-            # Find first pending subtask in this phase
-            for subtask in phase.get("subtasks", phase.get("chunks", [])):
-                status = subtask.get("status", "pending")
-                if status in {"pending", "not_started", "not started"}:
-                    subtask_out, _changed = normalize_subtask_aliases(subtask)
-                    subtask_out["status"] = "pending"
-                    return {
-                        **subtask_out,
-                        "phase_id": phase_id,
-                        "phase_name": phase.get("name"),
-                        "phase_num": phase.get("phase"),
-                    }
 
-        return None
+def _find_next_subtask(plan: dict) -> dict | None:
+    """Find the next pending subtask in an already-loaded plan."""
+    phases = plan.get("phases", [])
+
+    # Build a map of phase completion
+    phase_complete: dict[str, bool] = {}
+    for i, phase in enumerate(phases):
+        phase_id_value = phase.get("id")
+        phase_id_raw = (
+            phase_id_value if phase_id_value is not None else phase.get("phase")
+        )
+        phase_id_key = str(phase_id_raw) if phase_id_raw is not None else f"unknown:{i}"
+        subtasks = phase.get("subtasks", phase.get("chunks", []))
+        phase_complete[phase_id_key] = all(
+            s.get("status") == "completed" for s in subtasks
+        )
+
+    # Find next available subtask
+    for phase in phases:
+        phase_id_value = phase.get("id")
+        phase_id = phase_id_value if phase_id_value is not None else phase.get("phase")
+        depends_on_raw = phase.get("depends_on", [])
+        if isinstance(depends_on_raw, list):
+            depends_on = [str(d) for d in depends_on_raw if d is not None]
+        elif depends_on_raw is None:
+            depends_on = []
+        else:
+            depends_on = [str(depends_on_raw)]
+
+        # Check if dependencies are satisfied
+        deps_satisfied = all(phase_complete.get(dep, False) for dep in depends_on)
+        if not deps_satisfied:
+            continue
+
+        # Find first pending subtask in this phase
+        for subtask in phase.get("subtasks", phase.get("chunks", [])):
+            status = subtask.get("status", "pending")
+            if status in {"pending", "not_started", "not started"}:
+                subtask_out, _changed = normalize_subtask_aliases(subtask)
+                subtask_out["status"] = "pending"
+                return {
+                    **subtask_out,
+                    "phase_id": phase_id,
+                    "phase_name": phase.get("name"),
+                    "phase_num": phase.get("phase"),
+                }
 
-    except (OSError, json.JSONDecodeError, UnicodeDecodeError):
-        return None
+    return None
 
 
 def format_duration(seconds: float) -> str:
@@ -9,6 +9,7 @@ Functions for setting up and initializing workspaces.
 import json
 import os
 import shutil
+import stat
 import subprocess
 import sys
 from pathlib import Path
@@ -233,17 +234,21 @@ def symlink_node_modules_to_worktree(
             debug(MODULE, f"Skipping {source_rel} - source does not exist")
             continue
 
-        # Skip if target already exists (don't overwrite existing node_modules)
-        if target_path.exists():
-            debug(MODULE, f"Skipping {target_rel} - target already exists")
-            continue
+        # Skip if target already exists (don't overwrite existing node_modules).
+        # A single lstat() covers both cases: it doesn't follow links, so it
+        # also catches broken symlinks that exists() would report as missing.
+        # Only "not there" errors mean missing; anything else (e.g. permission
+        # denied) propagates, as it did with exists().
+        try:
+            target_stat = os.lstat(target_path)
+        except (FileNotFoundError, NotADirectoryError):
+            target_stat = None
 
-        # Also skip if target is a symlink (even if broken - exists() returns False for broken symlinks)
-        if target_path.is_symlink():
-            debug(
-                MODULE,
-                f"Skipping {target_rel} - symlink already exists (possibly broken)",
-            )
+        if target_stat is not None:
+            if stat.S_ISLNK(target_stat.st_mode):
+                debug(MODULE, f"Skipping {target_rel} - symlink already exists")
+            else:
+                debug(MODULE, f"Skipping {target_rel} - target already exists")
             continue
 
         # Ensure parent directory exists
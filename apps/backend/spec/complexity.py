@@ -22,6 +22,44 @@ class Complexity(Enum):
     COMPLEX = "complex"  # 10+ files, multiple services, external integrations
 
 
+# Default phase sequences per complexity tier, used when the AI assessment
+# doesn't recommend its own. historical_context runs early (after discovery)
+# if Graphiti is enabled - it's included by default but gracefully skips if
+# not configured.
+_SIMPLE_PHASES = ("discovery", "historical_context", "quick_spec", "validation")
+_STANDARD_PHASES = (
+    "discovery",
+    "historical_context",
+    "requirements",
+    "context",
+    "spec_writing",
+    "planning",
+    "validation",
+)
+# Standard can optionally include research if flagged
+_STANDARD_RESEARCH_PHASES = (
+    "discovery",
+    "historical_context",
+    "requirements",
+    "research",
+    "context",
+    "spec_writing",
+    "planning",
+    "validation",
+)
+_COMPLEX_PHASES = (
+    "discovery",
+    "historical_context",
+    "requirements",
+    "research",
+    "context",
+    "spec_writing",
+    "self_critique",
+    "planning",
+    "validation",
+)
+
+
 @dataclass
 class ComplexityAssessment:
     """Result of analyzing task complexity."""
@@ -51,29 +89,14 @@ class ComplexityAssessment:
             return self.recommended_phases
 
         # Otherwise fall back to default phase sets
-        # Note: historical_context runs early (after discovery) if Graphiti is enabled
-        # It's included by default but gracefully skips if not configured
         if self.complexity == Complexity.SIMPLE:
-            return ["discovery", "historical_context", "quick_spec", "validation"]
+            return list(_SIMPLE_PHASES)
         elif self.complexity == Complexity.STANDARD:
-            # Standard can optionally include research if flagged
-            phases = ["discovery", "historical_context", "requirements"]
             if self.needs_research:
-                phases.append("research")
-            phases.extend(["context", "spec_writing", "planning", "validation"])
-            return phases
+                return list(_STANDARD_RESEARCH_PHASES)
+            return list(_STANDARD_PHASES)
         else:  # COMPLEX
-            return [
-                "discovery",
-                "historical_context",
-                "requirements",
-                "research",
-                "context",
-                "spec_writing",
-                "self_critique",
-                "planning",
-                "validation",
-            ]
+            return list(_COMPLEX_PHASES)
 
 
 class ComplexityAnalyzer:
@@ -46,6 +46,10 @@ from .models import (
     rename_spec_dir_from_requirements,
 )
 
+# Phases that always run before complexity assessment, so they're excluded
+# from the complexity-driven phase list
+_PRE_ASSESSMENT_PHASES = frozenset({"discovery", "requirements"})
+
 
 class SpecOrchestrator:
     """Orchestrates the spec creation process with dynamic complexity adaptation."""
@@ -352,7 +356,7 @@ class SpecOrchestrator:
         # Get remaining phases to run based on complexity
         all_phases_to_run = self.assessment.phases_to_run()
         phases_to_run = [
-            p for p in all_phases_to_run if p not in ["discovery", "requirements"]
+            p for p in all_phases_to_run if p not in _PRE_ASSESSMENT_PHASES
         ]
 
         print()
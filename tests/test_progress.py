@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+Tests for Progress Tracking
+===========================
+
+Characterization tests for core/progress.py covering:
+- Subtask counting and next-subtask lookup from implementation_plan.json
+- The progress summary printed between sessions
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+from core import progress
+from core.progress import count_subtasks, get_next_subtask, print_progress_summary
+
+
+def _write_plan(spec_dir: Path, plan: dict) -> None:
+    (spec_dir / "implementation_plan.json").write_text(
+        json.dumps(plan, indent=2), encoding="utf-8"
+    )
+
+
+@pytest.fixture
+def phase_calls(monkeypatch):
+    """Record (name, completed, total, status) for each printed phase."""
+    calls = []
+    monkeypatch.setattr(
+        progress,
+        "print_phase_status",
+        lambda name, completed, total, status: calls.append(
+            (name, completed, total, status)
+        ),
+    )
+    return calls
+
+
+DEPENDENT_PLAN = {
+    "phases": [
+        {
+            "id": "setup",
+            "name": "Setup",
+            "subtasks": [
+                {"id": "1.1", "status": "completed"},
+                {"id": "1.2", "status": "pending", "description": "Add config"},
+            ],
+        },
+        {
+            "id": "build",
+            "name": "Build",
+            "depends_on": ["setup"],
+            "subtasks": [{"id": "2.1", "status": "pending"}],
+        },
+        {
+            "id": "docs",
+            "name": "Docs",
+            "subtasks": [{"id": "3.1", "status": "pending"}],
+        },
+    ]
+}
+
+
+class TestCountSubtasks:
+    """Tests for count_subtasks()."""
+
+    def test_missing_plan(self, spec_dir: Path):
+        """Missing plan counts as no subtasks."""
+        assert count_subtasks(spec_dir) == (0, 0)
+
+    def test_corrupt_plan(self, spec_dir: Path):
+        """Corrupt plan counts as no subtasks."""
+        (spec_dir / "implementation_plan.json").write_text("{not json")
+        assert count_subtasks(spec_dir) == (0, 0)
+
+    def test_counts_completed_and_total(self, spec_dir: Path):
+        """Counts completed and total subtasks across phases."""
+        _write_plan(spec_dir, DEPENDENT_PLAN)
+        assert count_subtasks(spec_dir) == (1, 4)
+
+    def test_chunks_are_not_counted(self, spec_dir: Path):
+        """Legacy `chunks` lists are not included in the count."""
+        _write_plan(
+            spec_dir,
+            {"phases": [{"id": "p1", "chunks": [{"id": "c1", "status": "pending"}]}]},
+        )
+        assert count_subtasks(spec_dir) == (0, 0)
+
+
+class TestGetNextSubtask:
+    """Tests for get_next_subtask()."""
+
+    def test_missing_plan(self, spec_dir: Path):
+        """Missing plan has no next subtask."""
+        assert get_next_subtask(spec_dir) is None
+
+    def test_corrupt_plan(self, spec_dir: Path):
+        """Corrupt plan has no next subtask."""
+        (spec_dir / "implementation_plan.json").write_text("{not json")
+        assert get_next_subtask(spec_dir) is None
+
+    def test_first_pending_in_unblocked_phase(self, spec_dir: Path):
+        """Returns the first pending subtask with phase metadata attached."""
+        _write_plan(spec_dir, DEPENDENT_PLAN)
+
+        next_subtask = get_next_subtask(spec_dir)
+
+        assert next_subtask["id"] == "1.2"
+        assert next_subtask["status"] == "pending"
+        assert next_subtask["phase_id"] == "setup"
+        assert next_subtask["phase_name"] == "Setup"
+
+    def test_skips_phase_with_unmet_dependencies(self, spec_dir: Path):
+        """Phases whose dependencies are incomplete are skipped."""
+        plan = json.loads(json.dumps(DEPENDENT_PLAN))
+        plan["phases"][0]["subtasks"][1]["status"] = "in_progress"
+        _write_plan(spec_dir, plan)
+
+        assert get_next_subtask(spec_dir)["id"] == "3.1"
+
+    def test_reads_chunks_style_plan(self, spec_dir: Path):
+        """Legacy `chunks` lists are searched for the next subtask."""
+        _write_plan(
+            spec_dir,
+            {"phases": [{"id": "p1", "chunks": [{"id": "c1", "status": "pending"}]}]},
+        )
+        assert get_next_subtask(spec_dir)["id"] == "c1"
+
+    def test_all_complete(self, spec_dir: Path):
+        """Fully completed plan has no next subtask."""
+        _write_plan(
+            spec_dir,
+            {
+                "phases": [
+                    {"id": "p1", "subtasks": [{"id": "1", "status": "completed"}]}
+                ]
+            },
+        )
+        assert get_next_subtask(spec_dir) is None
+
+
+class TestPrintProgressSummary:
+    """Tests for print_progress_summary()."""
+
+    @pytest.mark.parametrize("contents", [None, "{not json", json.dumps({})])
+    def test_no_subtasks(self, spec_dir: Path, capsys, phase_calls, contents):
+        """Missing, corrupt and empty plans all report that planning is needed."""
+        if contents is not None:
+            (spec_dir / "implementation_plan.json").write_text(contents)
+
+        print_progress_summary(spec_dir)
+
+        out = capsys.readouterr().out
+        assert "No implementation subtasks yet" in out
+        assert "Progress:" not in out
+        assert phase_calls == []
+
+    def test_chunks_style_plan_has_no_subtasks(
+        self, spec_dir: Path, capsys, phase_calls
+    ):
+        """A plan using only `chunks` is treated as having no subtasks."""
+        _write_plan(
+            spec_dir,
+            {"phases": [{"id": "p1", "chunks": [{"id": "c1", "status": "pending"}]}]},
+        )
+
+        print_progress_summary(spec_dir)
+
+        assert "No implementation subtasks yet" in capsys.readouterr().out
+        assert phase_calls == []
+
+    def test_phase_statuses_and_next_subtask(self, spec_dir: Path, capsys, phase_calls):
+        """Phases report in-progress, blocked and pending, then the next subtask."""
+        _write_plan(spec_dir, DEPENDENT_PLAN)
+
+        print_progress_summary(spec_dir)
+
+        out = capsys.readouterr().out
+        assert "1/4" in out
+        assert "3 subtasks remaining" in out
+        assert phase_calls == [
+            ("Setup", 1, 2, "in_progress"),
+            ("Build", 0, 1, "blocked"),
+            ("Docs", 0, 1, "pending"),
+        ]
+        assert "Next:" in out
+        assert "1.2" in out
+        assert "Add config" in out
+
+    def test_show_next_false(self, spec_dir: Path, capsys, phase_calls):
+        """The next subtask is omitted when show_next is False."""
+        _write_plan(spec_dir, DEPENDENT_PLAN)
+
+        print_progress_summary(spec_dir, show_next=False)
+
+        assert "Next:" not in capsys.readouterr().out
+
+    def test_build_complete(self, spec_dir: Path, capsys, phase_calls):
+        """A fully completed plan reports build complete with no next subtask."""
+        _write_plan(
+            spec_dir,
+            {
+                "phases": [
+                    {
+                        "id": "p1",
+                        "name": "Only",
+                        "subtasks": [{"id": "1", "status": "completed"}],
+                    }
+                ]
+            },
+        )
+
+        print_progress_summary(spec_dir)
+
+        out = capsys.readouterr().out
+        assert "BUILD COMPLETE" in out
+        assert "Next:" not in out
+        assert phase_calls == [("Only", 1, 1, "complete")]
@@ -10,7 +10,9 @@ Tests the workspace.py module functionality including:
 - Build finalization workflows
 """
 
+import os
 import subprocess
+import sys
 from pathlib import Path
 
 import pytest
@@ -1062,3 +1064,77 @@ class TestRebaseErrorHandling:
                 cwd=temp_git_repo,
                 capture_output=True,
             )
+
+
+@pytest.mark.skipif(
+    sys.platform == "win32", reason="Windows uses junctions, not symlinks"
+)
+class TestSymlinkNodeModules:
+    """Tests for linking node_modules into a worktree."""
+
+    @pytest.fixture
+    def project_and_worktree(self, temp_dir: Path):
+        """Create a project with node_modules and an empty worktree."""
+        project_dir = temp_dir / "project"
+        (project_dir / "node_modules").mkdir(parents=True)
+        worktree_path = temp_dir / "worktree"
+        worktree_path.mkdir()
+        return project_dir, worktree_path
+
+    def test_links_missing_target(self, project_and_worktree):
+        """Missing target is linked to the project's node_modules."""
+        from core.workspace.setup import symlink_node_modules_to_worktree
+
+        project_dir, worktree_path = project_and_worktree
+
+        result = symlink_node_modules_to_worktree(project_dir, worktree_path)
+
+        target = worktree_path / "node_modules"
+        assert result == ["node_modules"]
+        assert target.is_symlink()
+        assert target.resolve() == (project_dir / "node_modules").resolve()
+
+    def test_skips_real_directory(self, project_and_worktree):
+        """Existing node_modules directory is left alone."""
+        from core.workspace.setup import symlink_node_modules_to_worktree
+
+        project_dir, worktree_path = project_and_worktree
+        target = worktree_path / "node_modules"
+        target.mkdir()
+
+        result = symlink_node_modules_to_worktree(project_dir, worktree_path)
+
+        assert result == []
+        assert target.is_dir()
+        assert not target.is_symlink()
+
+    def test_skips_symlink_to_directory(self, project_and_worktree, temp_dir):
+        """Existing symlink to a directory is not replaced."""
+        from core.workspace.setup import symlink_node_modules_to_worktree
+
+        project_dir, worktree_path = project_and_worktree
+        other = temp_dir / "other_modules"
+        other.mkdir()
+        target = worktree_path / "node_modules"
+        target.symlink_to(other)
+
+        result = symlink_node_modules_to_worktree(project_dir, worktree_path)
+
+        assert result == []
+        assert target.resolve() == other.resolve()
+
+    def test_skips_broken_symlink(self, project_and_worktree, temp_dir):
+        """Broken symlink is not replaced (exists() alone would miss it)."""
+        from core.workspace.setup import symlink_node_modules_to_worktree
+
+        project_dir, worktree_path = project_and_worktree
+        missing = temp_dir / "gone"
+        target = worktree_path / "node_modules"
+        target.symlink_to(missing)
+
+        result = symlink_node_modules_to_worktree(project_dir, worktree_path)
+
+        assert result == []
+        assert target.is_symlink()
+        assert not target.exists()
+        assert Path(os.readlink(target)) == missing